@@ -69,6 +69,23 @@ class AgentkitA2aApp(BaseAgentkitApp):
 
         self._agent_executor: AgentExecutor | None = None
         self._task_store: TaskStore | None = None
+        self._startup_hooks: list[Callable] = []
+
+    def on_startup(self, func: Callable) -> Callable:
+        """Register a callable to run when the server starts.
+
+        Hooks run before the first request is served, which makes them the
+        place for warm-up work (pre-loading model/tool state) so the first
+        user request does not pay the cold-start cost. Both sync and async
+        callables are accepted.
+
+        Example:
+            >>> @a2a_app.on_startup
+            ... async def warmup():
+            ...     await runner.run(messages="ping", session_id="_warmup")
+        """
+        self._startup_hooks.append(func)
+        return func
 
     def agent_executor(self, **kwargs) -> Callable:
         """Wrap an AgentExecutor class, init it, then bind it to the app instance."""
@@ -130,4 +147,7 @@ class AgentkitA2aApp(BaseAgentkitApp):
             ),
         ).build()
 
+        for hook in self._startup_hooks:
+            a2a_app.add_event_handler("startup", hook)
+
         uvicorn.run(a2a_app, host=host, port=port)
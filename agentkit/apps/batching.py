@@ -0,0 +1,131 @@
+# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Request coalescing for batched backend calls.
+
+N concurrent requests that each trigger their own LLM RPC pay N round
+trips of HTTP, tokenizer and scheduling overhead. BatchQueue collects
+requests that arrive within a small time window and hands them to a
+single batch handler, amortizing that overhead across the batch on
+backends that support batched calls (OpenAI/vLLM-style batch chat).
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("agentkit." + __name__)
+
+
+class BatchQueue:
+    """Coalesce concurrent submissions into batched handler calls.
+
+    Callers await submit(item); items accumulating within ``max_wait_ms``
+    (or until ``max_batch`` is reached, whichever comes first) are passed
+    as one list to ``batch_handler``, which must return one result per
+    item, in order. Each caller's await resolves with its own result.
+
+    Example:
+        >>> async def batch_chat(prompts: list) -> list:
+        ...     return await provider.batch_chat(prompts)
+        >>>
+        >>> queue = BatchQueue(batch_chat, max_batch=32, max_wait_ms=10)
+        >>>
+        >>> # inside the executor, per request:
+        >>> reply = await queue.submit(prompt)
+    """
+
+    def __init__(
+        self,
+        batch_handler: Callable[[List[Any]], Awaitable[Sequence[Any]]],
+        max_batch: int = 32,
+        max_wait_ms: float = 10.0,
+    ) -> None:
+        """Initialize BatchQueue.
+
+        Args:
+            batch_handler: Async callable receiving the list of batched
+                items and returning one result per item, in order.
+            max_batch: Flush as soon as this many items are pending.
+            max_wait_ms: Maximum time the first item in a batch waits for
+                company before the batch is flushed anyway.
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be >= 1")
+
+        self._batch_handler = batch_handler
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000.0
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    async def submit(self, item: Any) -> Any:
+        """Submit one item and await its individual result."""
+        future = asyncio.get_running_loop().create_future()
+        full_batch = None
+
+        async with self._lock:
+            self._pending.append((item, future))
+            if len(self._pending) >= self._max_batch:
+                full_batch = self._pending
+                self._pending = []
+                if self._flush_task is not None:
+                    self._flush_task.cancel()
+                    self._flush_task = None
+            elif self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_after_wait())
+
+        if full_batch is not None:
+            # Run the full batch without serializing it behind this caller
+            asyncio.create_task(self._run_batch(full_batch))
+
+        return await future
+
+    async def _flush_after_wait(self) -> None:
+        """Flush whatever is pending once the wait window elapses."""
+        try:
+            await asyncio.sleep(self._max_wait)
+        except asyncio.CancelledError:
+            # A size-triggered flush already took the pending items
+            return
+
+        async with self._lock:
+            self._flush_task = None
+            batch = self._pending
+            self._pending = []
+
+        if batch:
+            await self._run_batch(batch)
+
+    async def _run_batch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Invoke the handler for one batch and resolve each caller's future."""
+        items = [item for item, _ in batch]
+        try:
+            results = await self._batch_handler(items)
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"batch_handler returned {len(results)} results "
+                    f"for {len(items)} items"
+                )
+        except Exception as e:
+            logger.error("Batch handler failed for %d items: %s", len(items), e)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -300,6 +300,12 @@ class LocalDockerBuilder(Builder):
                     self.reporter.info(f"Target platform: {docker_build_config.platform}")
                 else:
                     self.reporter.info("Target platform: auto-detect")
+
+            if docker_build_config and docker_build_config.cache_from:
+                build_kwargs['cache_from'] = docker_build_config.cache_from
+                self.reporter.info(
+                    f"Using layer cache from: {', '.join(docker_build_config.cache_from)}"
+                )
             
             self.reporter.info("Executing Docker build...")
             success, build_logs, image_id = self.docker_manager.build_image(**build_kwargs)
@@ -261,10 +261,21 @@ class AgentkitConfigManager:
         }
     
     def _save_config(self):
-        """Save configuration file"""
+        """Save configuration file.
+
+        Writes to a temporary file and renames it into place so a crash
+        mid-write never leaves a truncated agentkit.yaml behind (rename is
+        atomic on POSIX).
+        """
         os.makedirs(self.config_path.parent, exist_ok=True)
-        with open(self.config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(self._data, f, default_flow_style=False, sort_keys=False)
+        tmp_path = self.config_path.with_suffix(f".tmp.{os.getpid()}")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                yaml.dump(self._data, f, default_flow_style=False, sort_keys=False)
+            os.replace(tmp_path, self.config_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
     
     def get_common_config(self) -> CommonConfig:
         """Get common configuration"""
@@ -404,18 +415,26 @@ class AgentkitConfigManager:
         """Get raw configuration data."""
         return self._data.copy()
     
-    def set_raw_value(self, key_path: str, value: Any):
-        """Directly set value at any path."""
+    def set_raw_value(self, key_path: str, value: Any, save: bool = True):
+        """Directly set value at any path.
+
+        Args:
+            key_path: Dot-separated key path
+            value: Value to set
+            save: Whether to persist immediately. Callers batching several
+                mutations can pass False and issue a single save afterwards.
+        """
         keys = key_path.split('.')
         current = self._data
-        
+
         for key in keys[:-1]:
             if key not in current:
                 current[key] = {}
             current = current[key]
-        
+
         current[keys[-1]] = value
-        self._save_config()
+        if save:
+            self._save_config()
     
     def get_raw_value(self, key_path: str, default: Any = None) -> Any:
         """Get value at any path."""
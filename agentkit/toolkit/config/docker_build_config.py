@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from dataclasses import dataclass, field
-from typing import Optional, Union, Dict
+from typing import List, Optional, Union, Dict
 from .dataclass_utils import AutoSerializableMixin
 
 
@@ -76,6 +76,19 @@ class DockerBuildConfig(AutoSerializableMixin):
         }
     )
     
+    cache_from: Optional[List[str]] = field(
+        default=None,
+        metadata={
+            "description": "Images to use as layer cache sources during build",
+            "detail": (
+                "List of image references whose layers can be reused as build "
+                "cache, e.g., ['my-registry/agent:latest']. Useful in CI where "
+                "the local layer cache is empty but a previously pushed image "
+                "is available, so unchanged dependency layers are not rebuilt."
+            )
+        }
+    )
+
     platform: Optional[str] = field(
         default=None,
         metadata={
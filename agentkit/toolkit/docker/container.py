@@ -258,11 +258,12 @@ class DockerManager:
         image_tag: str = "latest",
         build_args: Optional[Dict[str, str]] = None,
         no_cache: bool = False,
-        platform: Optional[str] = None
+        platform: Optional[str] = None,
+        cache_from: Optional[List[str]] = None
     ) -> Tuple[bool, str, Optional[str]]:
         """
         Build Docker image.
-        
+
         Args:
             dockerfile_path: Path to Dockerfile directory
             image_name: Image name
@@ -270,7 +271,8 @@ class DockerManager:
             build_args: Build arguments
             no_cache: Whether to disable cache
             platform: Target platform
-            
+            cache_from: Image references to use as layer cache sources
+
         Returns:
             (build_success, build_logs, image_id)
         """
@@ -301,7 +303,10 @@ class DockerManager:
             
             if platform:
                 build_kwargs['platform'] = platform
-            
+
+            if cache_from:
+                build_kwargs['cache_from'] = cache_from
+
             build_output = self.client.api.build(**build_kwargs)
             
             for chunk in build_output:
@@ -360,6 +360,24 @@ class InvokeResult:
             return f"InvokeResult(success=False, error={self.error_code or 'UNKNOWN'})"
 
 
+@dataclass
+class AsyncInvokeResult:
+    """Handle for an asynchronously submitted invoke operation.
+
+    Returned by AgentKitClient.submit_invoke(). The invocation runs in the
+    background; poll AgentKitClient.get_task() with the task_id to observe
+    progress and retrieve the final InvokeResult.
+    """
+    task_id: str
+    """Unique identifier for the submitted task"""
+
+    status: str = "pending"
+    """Task state at submission time: 'pending', 'running', 'succeeded', or 'failed'"""
+
+    def __str__(self) -> str:
+        return f"AsyncInvokeResult(task_id={self.task_id}, status={self.status})"
+
+
 @dataclass
 class StatusResult:
     """Result of a status query operation.
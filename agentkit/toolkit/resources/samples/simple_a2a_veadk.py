@@ -13,11 +13,7 @@
 # limitations under the License.
 
 import logging
-
-from google.adk.a2a.executor.a2a_agent_executor import A2aAgentExecutor
-from veadk import Agent, Runner
-from veadk.a2a.agent_card import get_agent_card
-from veadk.tools.demo_tools import get_city_weather
+import os
 
 from agentkit.apps import AgentkitA2aApp
 
@@ -27,20 +23,62 @@ logger = logging.getLogger(__name__)
 a2a_app = AgentkitA2aApp()
 
 app_name = "weather_reporter"
-agent = Agent(tools=[get_city_weather])
-runner = Runner(agent=agent)
 
 
-@a2a_app.agent_executor(runner=runner)
-class MyAgentExecutor(A2aAgentExecutor):
-    """Use Google ADK A2aAgentExecutor directly."""
+def main():
+    # The google.adk / veadk imports pull in the gRPC, protobuf and HTTP
+    # stacks (hundreds of ms), so they are deferred until the app actually
+    # starts instead of being paid on every module import.
+    from google.adk.a2a.executor.a2a_agent_executor import A2aAgentExecutor
+    from veadk import Agent, Runner
+    from veadk.a2a.agent_card import get_agent_card
+    from veadk.tools.demo_tools import get_city_weather
 
-    pass
+    tools = [get_city_weather]
 
+    if os.getenv("AGENTKIT_JIT_WARMUP", "1") == "1":
+        # Tools backed by JIT-compiled internals (e.g. numba @njit helpers)
+        # pay their compilation cost on first call. Tools can opt in to a
+        # pre-serve compile by exposing `_warmup_args`; we invoke them once
+        # here so the compiled artifact is ready before the first request.
+        for tool in tools:
+            warmup_args = getattr(tool, "_warmup_args", None)
+            if warmup_args is None:
+                continue
+            tool_name = getattr(tool, "__name__", repr(tool))
+            try:
+                tool(*warmup_args)
+                logger.info("Warmed up tool: %s", tool_name)
+            except Exception as e:
+                logger.warning("Tool warm-up failed for %s: %s", tool_name, e)
+
+    agent = Agent(tools=tools)
+    runner = Runner(agent=agent)
+
+    @a2a_app.agent_executor(runner=runner)
+    class MyAgentExecutor(A2aAgentExecutor):
+        """Use Google ADK A2aAgentExecutor directly."""
+
+        pass
+
+    if os.getenv("AGENTKIT_WARMUP") == "1":
+
+        @a2a_app.on_startup
+        async def warmup():
+            # Run a throwaway prompt at startup so model/tool state is
+            # loaded before the first user request hits the executor.
+            logger.info("Warming up agent...")
+            await runner.run(
+                messages="ping", user_id="_warmup", session_id="_warmup"
+            )
+            logger.info("Warm-up complete")
 
-if __name__ == "__main__":
     a2a_app.run(
         agent_card=get_agent_card(agent=agent, url="http://0.0.0.0:8000"),
         host="0.0.0.0",
         port=8000,
     )
+
+
+if __name__ == "__main__":
+    main()
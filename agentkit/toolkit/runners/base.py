@@ -14,7 +14,9 @@
 
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, Union, Generator, Tuple
+import atexit
 import logging
+import threading
 import requests
 import json
 
@@ -24,6 +26,45 @@ from agentkit.toolkit.reporter import Reporter, SilentReporter
 logger = logging.getLogger(__name__)
 
 
+def _create_http_session() -> requests.Session:
+    """Create a requests.Session with connection pooling and keep-alive.
+
+    Reusing one session across invocations amortizes TCP + TLS handshakes,
+    which saves roughly one round trip plus TLS setup per call against
+    remote deployments.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def _get_shared_session() -> requests.Session:
+    """Return the process-wide pooled HTTP session, creating it on first use.
+
+    Runners are short-lived (the SDK builds a fresh executor/strategy/runner
+    chain per call), so a per-instance session would be discarded before its
+    keep-alive connections could ever be reused. Sharing one session at module
+    level is what actually lets repeated calls against the same endpoint skip
+    the TCP + TLS handshake. The session is closed once, at interpreter exit.
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = _create_http_session()
+                atexit.register(_shared_session.close)
+    return _shared_session
+
+
 class Runner(ABC):
     """
     Abstract base class for service runners.
@@ -51,6 +92,10 @@ class Runner(ABC):
         """
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.reporter = reporter or SilentReporter()
+        # Shared HTTP session so repeated deploy/status/invoke calls reuse
+        # pooled keep-alive connections instead of re-handshaking per call,
+        # even though each call builds a fresh Runner instance
+        self.http_session = _get_shared_session()
     
     @abstractmethod
     def deploy(self, config: Dict[str, Any]) -> DeployResult:
@@ -129,14 +174,21 @@ class Runner(ABC):
                 stream = True
             else:
                 logger.debug(f"{'Streaming' if stream else 'Normal'} invoke service: {endpoint}")
-            
+
             # Use longer timeout for streaming calls
             actual_timeout = timeout if not stream else max(timeout, 300)
-            
-            response = requests.post(
+
+            # Advertise SSE support so the server emits text/event-stream
+            # chunks as they are produced instead of buffering the full body.
+            # Caller-provided headers take priority over the default Accept.
+            request_headers = dict(headers) if headers else {}
+            if stream:
+                request_headers.setdefault("Accept", "text/event-stream")
+
+            response = self.http_session.post(
                 url=endpoint,
                 json=payload,
-                headers=headers,
+                headers=request_headers,
                 timeout=actual_timeout,
                 stream=stream
             )
@@ -204,7 +204,7 @@ class VeAgentkitRuntimeRunner(Runner):
             public_endpoint = self.get_public_endpoint_of_runtime(runtime)
             if runtime.status == RUNTIME_STATUS_READY and public_endpoint:
                 try:
-                    ping_response = requests.get(
+                    ping_response = self.http_session.get(
                         urljoin(public_endpoint, "ping"), 
                         headers={"Authorization": f"Bearer {runner_config.runtime_apikey}"},
                         timeout=10
@@ -512,7 +512,7 @@ class VeAgentkitRuntimeRunner(Runner):
         self.reporter.info("Downloading failure logs...")
 
         try:
-            log_response = requests.get(runtime.failed_log_file_url, timeout=30)
+            log_response = self.http_session.get(runtime.failed_log_file_url, timeout=30)
             log_response.raise_for_status()
 
             # Create logs directory with timestamp-based filename for uniqueness
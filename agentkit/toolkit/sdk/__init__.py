@@ -60,6 +60,7 @@ from ..models import (
     BuildResult,
     DeployResult,
     InvokeResult,
+    AsyncInvokeResult,
     StatusResult,
     LifecycleResult,
     InitResult,
@@ -83,6 +84,7 @@ __all__ = [
     "BuildResult",
     "DeployResult",
     "InvokeResult",
+    "AsyncInvokeResult",
     "StatusResult",
     "LifecycleResult",
     "InitResult",
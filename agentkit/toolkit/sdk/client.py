@@ -14,7 +14,10 @@
 
 """AgentKit SDK Client - Configuration management and simplified API."""
 
-from typing import Optional, Dict, Any, Union
+import asyncio
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Union
 
 from .builder import build as _build
 from .deployer import deploy as _deploy
@@ -27,6 +30,7 @@ from ..models import (
     BuildResult,
     DeployResult,
     InvokeResult,
+    AsyncInvokeResult,
     StatusResult,
     LifecycleResult,
     InitResult
@@ -124,6 +128,10 @@ class AgentKitClient:
             raise TypeError(
                 f"config must be AgentConfig, str, or None, got {type(config).__name__}"
             )
+
+        # Background task state for submit_invoke/get_task (lazily created)
+        self._task_pool: Optional[ThreadPoolExecutor] = None
+        self._tasks: Dict[str, Future] = {}
     
     @property
     def config(self) -> 'AgentConfig':
@@ -207,6 +215,27 @@ class AgentKitClient:
             platform=platform
         )
     
+    async def build_async(
+        self,
+        platform: str = "auto",
+        config_overrides: Optional[Dict[str, Any]] = None
+    ) -> BuildResult:
+        """
+        Awaitable variant of build() for asyncio applications.
+
+        Runs the build in a worker thread so the event loop stays free to
+        overlap other work (e.g., dataset preparation, other agents'
+        deployments) with the image build.
+
+        Example:
+            >>> build_task = asyncio.create_task(client.build_async())
+            >>> await prepare_dataset()  # overlaps with the build
+            >>> build_result = await build_task
+        """
+        return await asyncio.to_thread(
+            self.build, platform=platform, config_overrides=config_overrides
+        )
+
     def deploy(
         self,
         config_overrides: Optional[Dict[str, Any]] = None
@@ -289,6 +318,196 @@ class AgentKitClient:
             apikey=apikey
         )
     
+    def invoke_batch(
+        self,
+        payloads: List[Dict[str, Any]],
+        headers: Optional[Dict[str, str]] = None,
+        concurrency: int = 16,
+        config_overrides: Optional[Dict[str, Any]] = None
+    ) -> List[InvokeResult]:
+        """
+        Invoke deployed agent with multiple payloads concurrently.
+
+        Agent invocations are I/O-bound, so dispatching them from a thread
+        pool overlaps network latency and approaches the server's concurrency
+        limit for dataset-scale workloads. Results are returned in the same
+        order as the input payloads.
+
+        Args:
+            payloads: List of request payload dictionaries.
+            headers: Optional HTTP headers shared by all requests.
+            concurrency: Maximum number of in-flight requests.
+            config_overrides: Optional configuration overrides for this operation.
+
+        Returns:
+            List of InvokeResult objects, one per payload, in input order.
+
+        Example:
+            >>> client = AgentKitClient("agentkit.yaml")
+            >>>
+            >>> # Dispatch several prompts concurrently
+            >>> results = client.invoke_batch([
+            ...     {"prompt": "Question 1"},
+            ...     {"prompt": "Question 2"},
+            ...     {"prompt": "Question 3"},
+            ... ], concurrency=4)
+            >>> for result in results:
+            ...     print(result.response)
+        """
+        if not payloads:
+            return []
+
+        max_workers = max(1, min(concurrency, len(payloads)))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(
+                    self.invoke,
+                    payload,
+                    headers=headers,
+                    config_overrides=config_overrides
+                )
+                for payload in payloads
+            ]
+            return [future.result() for future in futures]
+
+    async def invoke_batch_async(
+        self,
+        payloads: List[Dict[str, Any]],
+        headers: Optional[Dict[str, str]] = None,
+        concurrency: int = 16,
+        config_overrides: Optional[Dict[str, Any]] = None
+    ) -> List[InvokeResult]:
+        """
+        Asynchronous variant of invoke_batch for asyncio applications.
+
+        Each invocation runs in a worker thread via asyncio.to_thread, with
+        an asyncio.Semaphore bounding the number of in-flight requests.
+
+        Args:
+            payloads: List of request payload dictionaries.
+            headers: Optional HTTP headers shared by all requests.
+            concurrency: Maximum number of in-flight requests.
+            config_overrides: Optional configuration overrides for this operation.
+
+        Returns:
+            List of InvokeResult objects, one per payload, in input order.
+
+        Example:
+            >>> import asyncio
+            >>>
+            >>> async def main():
+            ...     client = AgentKitClient("agentkit.yaml")
+            ...     return await client.invoke_batch_async(
+            ...         [{"prompt": f"Question {i}"} for i in range(10)]
+            ...     )
+            >>> results = asyncio.run(main())
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def bounded_invoke(payload: Dict[str, Any]) -> InvokeResult:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.invoke,
+                    payload,
+                    headers=headers,
+                    config_overrides=config_overrides
+                )
+
+        return await asyncio.gather(*(bounded_invoke(p) for p in payloads))
+
+    def submit_invoke(
+        self,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        config_overrides: Optional[Dict[str, Any]] = None
+    ) -> AsyncInvokeResult:
+        """
+        Submit an invoke operation without blocking on the response.
+
+        Long-running prompts can take minutes to complete; submit_invoke
+        returns immediately with a task handle so the caller can keep
+        submitting work and poll for completion via get_task().
+
+        Args:
+            payload: Request payload dictionary to send to agent.
+            headers: Optional HTTP headers dictionary.
+            config_overrides: Optional configuration overrides for this operation.
+
+        Returns:
+            AsyncInvokeResult: Handle containing the task_id to poll.
+
+        Example:
+            >>> client = AgentKitClient("agentkit.yaml")
+            >>>
+            >>> # Submit and poll
+            >>> handle = client.submit_invoke({"prompt": "Write a long plan"})
+            >>> task = client.get_task(handle.task_id)
+            >>> while task["state"] in ("pending", "running"):
+            ...     time.sleep(1)
+            ...     task = client.get_task(handle.task_id)
+            >>> print(task["response"].response)
+        """
+        if self._task_pool is None:
+            self._task_pool = ThreadPoolExecutor(
+                max_workers=8,
+                thread_name_prefix="agentkit-invoke"
+            )
+
+        task_id = uuid.uuid4().hex
+        future = self._task_pool.submit(
+            self.invoke,
+            payload,
+            headers=headers,
+            config_overrides=config_overrides
+        )
+        self._tasks[task_id] = future
+        return AsyncInvokeResult(task_id=task_id, status="pending")
+
+    def get_task(self, task_id: str) -> Dict[str, Any]:
+        """
+        Query the state of a task submitted via submit_invoke().
+
+        Args:
+            task_id: Task identifier returned by submit_invoke().
+
+        Returns:
+            Dictionary with:
+                - state: 'pending', 'running', 'succeeded', or 'failed'
+                - response: InvokeResult once finished, otherwise None
+                - error: Error message when state is 'failed', otherwise None
+
+        Raises:
+            KeyError: If task_id is unknown to this client instance, or if
+                a terminal state ('succeeded'/'failed') was already returned
+                for it — terminal tasks are evicted so long-running
+                submit-and-poll loops don't accumulate finished results.
+
+        Example:
+            >>> handle = client.submit_invoke({"prompt": "Hello"})
+            >>> task = client.get_task(handle.task_id)
+            >>> print(task["state"])
+        """
+        future = self._tasks.get(task_id)
+        if future is None:
+            raise KeyError(f"Unknown task_id: {task_id}")
+
+        if not future.done():
+            state = "running" if future.running() else "pending"
+            return {"state": state, "response": None, "error": None}
+
+        # Terminal state: drop the entry so completed futures (and the
+        # InvokeResults they hold) don't pile up across a long session
+        del self._tasks[task_id]
+
+        exception = future.exception()
+        if exception is not None:
+            return {"state": "failed", "response": None, "error": str(exception)}
+
+        result: InvokeResult = future.result()
+        if result.success:
+            return {"state": "succeeded", "response": result, "error": None}
+        return {"state": "failed", "response": result, "error": result.error}
+
     def status(
         self,
         config_overrides: Optional[Dict[str, Any]] = None
@@ -350,6 +569,28 @@ class AgentKitClient:
             platform=platform
         )
     
+    async def launch_async(
+        self,
+        platform: str = "auto",
+        config_overrides: Optional[Dict[str, Any]] = None
+    ) -> LifecycleResult:
+        """
+        Awaitable variant of launch() (build + deploy) for asyncio applications.
+
+        Within this client the deploy step consumes the image produced by the
+        build, so the two stages themselves stay sequential; running them in a
+        worker thread lets callers overlap the whole launch with independent
+        work instead of blocking the event loop for its full duration.
+
+        Example:
+            >>> launch_task = asyncio.create_task(client.launch_async())
+            >>> await warm_up_eval_harness()  # overlaps with build + deploy
+            >>> result = await launch_task
+        """
+        return await asyncio.to_thread(
+            self.launch, platform=platform, config_overrides=config_overrides
+        )
+
     def destroy(
         self,
         force: bool = False,
@@ -413,11 +654,13 @@ class AgentKitClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
         Context manager exit - cleanup if needed.
-        
-        Currently no cleanup is needed, but this allows for
-        future resource management (e.g., connection pooling).
+
+        Shuts down the background task pool used by submit_invoke(),
+        waiting for in-flight tasks to complete.
         """
-        pass
+        if self._task_pool is not None:
+            self._task_pool.shutdown(wait=True)
+            self._task_pool = None
     
     @staticmethod
     def init_project(
@@ -36,6 +36,7 @@ Example:
     >>> client = AgentKitClient(config)
 """
 
+from contextlib import contextmanager
 from typing import Optional, Dict, Any, Union
 from pathlib import Path
 import logging
@@ -83,9 +84,9 @@ class AgentConfig:
         ...       .set_model("deepseek-v3") \\
         ...       .save()
         >>> 
-        >>> # Path-based access
+        >>> # Path-based access (set() defers persistence — call save())
         >>> region = config.get("launch_types.cloud.region")
-        >>> config.set("launch_types.hybrid.image_tag", "v1.0.0")
+        >>> config.set("launch_types.hybrid.image_tag", "v1.0.0").save()
     """
     
     def __init__(self, file_path: Union[str, Path]):
@@ -121,6 +122,9 @@ class AgentConfig:
         
         # Cache common config for quick access
         self._common_config = self._manager.get_common_config()
+
+        # Tracks unsaved in-memory mutations (see batch_update/save)
+        self._dirty = False
     
     @classmethod
     def load(cls, path: Union[str, Path]) -> 'AgentConfig':
@@ -170,6 +174,7 @@ class AgentConfig:
                 f"Must be one of: {', '.join(valid_types)}"
             )
         self._common_config.launch_type = value
+        self._dirty = True
         logger.debug(f"Set launch_type to '{value}'")
     
     @property
@@ -185,6 +190,7 @@ class AgentConfig:
     def agent_name(self, value: str):
         """Set agent name."""
         self._common_config.agent_name = value
+        self._dirty = True
         logger.debug(f"Set agent_name to '{value}'")
     
     @property
@@ -200,6 +206,7 @@ class AgentConfig:
     def entry_point(self, value: str):
         """Set entry point."""
         self._common_config.entry_point = value
+        self._dirty = True
         logger.debug(f"Set entry_point to '{value}'")
     
     @property
@@ -215,6 +222,7 @@ class AgentConfig:
     def description(self, value: str):
         """Set description."""
         self._common_config.description = value
+        self._dirty = True
         logger.debug(f"Set description to '{value}'")
     
     @property
@@ -232,6 +240,7 @@ class AgentConfig:
     def language(self, value: str):
         """Set language."""
         self._common_config.language = value
+        self._dirty = True
         logger.debug(f"Set language to '{value}'")
     
     @property
@@ -247,6 +256,7 @@ class AgentConfig:
     def language_version(self, value: str):
         """Set language version."""
         self._common_config.language_version = value
+        self._dirty = True
         logger.debug(f"Set language_version to '{value}'")
     
     @property
@@ -262,6 +272,7 @@ class AgentConfig:
     def dependencies_file(self, value: str):
         """Set dependencies file."""
         self._common_config.dependencies_file = value
+        self._dirty = True
         logger.debug(f"Set dependencies_file to '{value}'")
     
     @property
@@ -282,6 +293,7 @@ class AgentConfig:
         if not isinstance(value, dict):
             raise TypeError("runtime_envs must be a dictionary")
         self._common_config.runtime_envs = value
+        self._dirty = True
         logger.debug(f"Set runtime_envs with {len(value)} entries")
     
     # ========== Path-based Access Methods ==========
@@ -311,32 +323,39 @@ class AgentConfig:
     
     def set(self, key_path: str, value: Any) -> 'AgentConfig':
         """Set configuration value by key path.
-        
+
         Supports dot-notation for nested access. Returns self for chaining.
-        
+
+        Changes are applied in memory only; nothing reaches disk until
+        save() is called (or the surrounding batch_update() block exits),
+        so a burst of set() calls costs a single write.
+
         Args:
             key_path: Dot-separated key path
             value: Value to set
-        
+
         Returns:
             Self for method chaining
-        
+
         Example:
             >>> config.set("common.launch_type", "hybrid")
             >>> config.set("launch_types.cloud.region", "cn-beijing")
-            >>> 
+            >>> config.save()  # required: set() alone does not persist
+            >>>
             >>> # Chaining
             >>> config.set("common.launch_type", "hybrid") \\
             ...       .set("launch_types.hybrid.image_tag", "v1.0") \\
             ...       .save()
         """
-        # Update internal data structure
-        self._manager.set_raw_value(key_path, value)
-        
+        # Update internal data structure; persistence is deferred to save()
+        # so a burst of set() calls costs one disk write instead of many
+        self._manager.set_raw_value(key_path, value, save=False)
+        self._dirty = True
+
         # If updating common config, reload cache
         if key_path.startswith("common."):
             self._common_config = self._manager.get_common_config()
-        
+
         logger.debug(f"Set '{key_path}' to '{value}'")
         return self
     
@@ -380,6 +399,7 @@ class AgentConfig:
             # Check if it's a top-level field in common config
             if hasattr(self._common_config, key):
                 setattr(self._common_config, key, value)
+                self._dirty = True
             # Check if it's a nested dictionary update
             elif isinstance(value, dict):
                 # Update nested structures
@@ -446,6 +466,7 @@ class AgentConfig:
             ...       .save()
         """
         self._common_config.runtime_envs[key] = value
+        self._dirty = True
         logger.debug(f"Added runtime_env: {key}={value}")
         return self
     
@@ -468,15 +489,37 @@ class AgentConfig:
         """
         # Update common config in manager
         self._manager.update_common_config(self._common_config)
-        
+        self._dirty = False
+
         # If new path specified, update file path
         if path:
             self.file_path = Path(path)
             # Note: The manager still uses the original path for saving
             # This is intentional to maintain consistency
-        
+
         logger.info(f"Configuration saved to {self.file_path}")
         return self
+
+    @contextmanager
+    def batch_update(self):
+        """Group several mutations into a single disk write.
+
+        Inside the context, setters and set() only mutate in-memory state;
+        one save() runs at exit. If the block raises, nothing is written.
+
+        Yields:
+            This AgentConfig instance.
+
+        Example:
+            >>> with config.batch_update() as cfg:
+            ...     cfg.launch_type = "local"
+            ...     cfg.add_runtime_env("LOG_LEVEL", "DEBUG")
+            ...     cfg.add_runtime_env("ENVIRONMENT", "development")
+            >>> # one YAML write, performed here
+        """
+        yield self
+        if self._dirty:
+            self.save()
     
     def reload(self) -> 'AgentConfig':
         """Reload configuration from file.
@@ -491,6 +534,7 @@ class AgentConfig:
         """
         self._manager.reload()
         self._common_config = self._manager.get_common_config()
+        self._dirty = False
         logger.info(f"Configuration reloaded from {self.file_path}")
         return self
     
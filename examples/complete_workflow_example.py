@@ -17,18 +17,67 @@ AgentKit SDK 完整工作流示例
 - ✅ 完整的错误处理
 """
 
+import atexit
+import json
+import os
+import signal
 import sys
 from agentkit.toolkit.sdk import AgentKitClient
 
+
+class Progress:
+    """结构化进度上报。
+
+    AGENTKIT_JSON=1 时输出 JSON-lines（{step, progress, message}，progress
+    单调递增，便于 dashboard / 日志采集直接消费）；否则保持原有的
+    分隔线样式。
+    """
+
+    def __init__(self, stream=None):
+        self._stream = stream or sys.stdout
+        self._json = os.environ.get("AGENTKIT_JSON") == "1"
+        self._last_frac = 0.0
+
+    def emit(self, step: str, frac: float, message: str):
+        assert frac >= self._last_frac, "progress must be monotonic"
+        self._last_frac = frac
+        if self._json:
+            self._stream.write(json.dumps(
+                {"step": step, "progress": round(frac, 3), "message": message},
+                ensure_ascii=False
+            ) + "\n")
+        else:
+            self._stream.write(f"{message}\n" + "-" * 70 + "\n")
+        self._stream.flush()
+
+
+# 总结模板：一次 format + 一次 write，代替逐行 print
+SUMMARY_TMPL = """📝 工作流总结:
+   • 项目路径: {project_path}
+   • 配置文件: {config_file}
+   • 启动模式: {launch_type}
+   • 镜像名称: {image_name}
+   • 服务端点: {endpoint_url}
+
+🎯 下一步操作:
+   1. 查看项目文件: cd {project_path}
+   2. 修改代码: vim {project_path}/{entry_point}
+   3. 重新构建: cd {project_path} && agentkit build
+   4. 查看状态: agentkit status
+
+"""
+
+
 def main():
+    progress = Progress()
+
     print("=" * 70)
     print("AgentKit SDK 完整工作流示例")
     print("=" * 70)
     print()
     
     # ========== Step 1: 初始化项目 ==========
-    print("📦 Step 1: 初始化项目...")
-    print("-" * 70)
+    progress.emit("init", 0.0, "📦 Step 1: 初始化项目...")
     
     init_result = AgentKitClient.init_project(
         project_name="demo_planning_agent",
@@ -51,8 +100,7 @@ def main():
     print()
     
     # ========== Step 2: 使用 AgentConfig 修改配置 ==========
-    print("🔧 Step 2: 配置 Agent (使用 AgentConfig API)...")
-    print("-" * 70)
+    progress.emit("configure", 0.125, "🔧 Step 2: 配置 Agent (使用 AgentConfig API)...")
     
     # ✅ 新方式：使用 InitResult.load_config()
     config = init_result.load_config()
@@ -66,22 +114,22 @@ def main():
     
     # 修改配置为 local 模式（方便本地测试）
     print("🔧 修改启动模式为 local...")
-    config.launch_type = "local"
-    
-    # 添加环境变量
-    config.add_runtime_env("LOG_LEVEL", "DEBUG")
-    config.add_runtime_env("ENVIRONMENT", "development")
-    
-    # 保存配置
-    config.save()
+
+    # ✅ 使用 batch_update 批量修改：多次变更只落盘一次
+    with config.batch_update() as cfg:
+        cfg.launch_type = "local"
+
+        # 添加环境变量
+        cfg.add_runtime_env("LOG_LEVEL", "DEBUG")
+        cfg.add_runtime_env("ENVIRONMENT", "development")
+
     print("✅ 配置已更新并保存")
     print(f"   启动模式: {config.launch_type}")
     print(f"   环境变量: {len(config.runtime_envs)} 个")
     print()
     
     # ========== Step 3: 创建 Client ==========
-    print("🤖 Step 3: 创建 AgentKitClient...")
-    print("-" * 70)
+    progress.emit("create_client", 0.25, "🤖 Step 3: 创建 AgentKitClient...")
     
     # ✅ 方式 1: 使用 AgentConfig 对象（推荐）
     client = AgentKitClient(config)
@@ -92,8 +140,7 @@ def main():
     # client = init_result.create_client(launch_type="local")
     
     # ========== Step 4: 构建 Agent ==========
-    print("🔨 Step 4: 构建 Agent 镜像...")
-    print("-" * 70)
+    progress.emit("build", 0.375, "🔨 Step 4: 构建 Agent 镜像...")
     
     build_result = client.build()
     
@@ -109,8 +156,7 @@ def main():
     print()
     
     # ========== Step 5: 部署 Agent ==========
-    print("🚀 Step 5: 部署 Agent...")
-    print("-" * 70)
+    progress.emit("deploy", 0.5, "🚀 Step 5: 部署 Agent...")
     
     deploy_result = client.deploy()
     
@@ -123,27 +169,38 @@ def main():
     print(f"   容器 ID: {deploy_result.container_id}")
     print(f"   服务 ID: {deploy_result.service_id}")
     print()
+
+    # 部署成功后注册兜底清理：进程异常退出（包括 docker stop 的 SIGTERM）时
+    # 强制销毁，防止 CI/批处理环境中泄漏容器
+    cleanup_state = {"armed": True}
+
+    def _cleanup_on_exit():
+        if cleanup_state["armed"]:
+            client.destroy(force=True)
+
+    atexit.register(_cleanup_on_exit)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
     
     # ========== Step 6: 查询状态 ==========
-    print("📊 Step 6: 查询 Agent 状态...")
-    print("-" * 70)
+    progress.emit("status", 0.625, "📊 Step 6: 查询 Agent 状态...")
     
     status_result = client.status()
     
     if status_result.success:
-        print("✅ 状态查询成功!")
-        print(f"   运行状态: {status_result.status.value}")
-        print(f"   是否运行: {'是' if status_result.is_running() else '否'}")
-        print(f"   服务端点: {status_result.endpoint_url}")
+        status_lines = [
+            "✅ 状态查询成功!",
+            f"   运行状态: {status_result.status.value}",
+            f"   是否运行: {'是' if status_result.is_running() else '否'}",
+            f"   服务端点: {status_result.endpoint_url}",
+        ]
         if status_result.uptime:
-            print(f"   运行时长: {status_result.uptime}")
+            status_lines.append(f"   运行时长: {status_result.uptime}")
+        sys.stdout.write("\n".join(status_lines) + "\n\n")
     else:
-        print(f"⚠️  状态查询失败: {status_result.error}")
-    print()
+        sys.stdout.write(f"⚠️  状态查询失败: {status_result.error}\n\n")
     
     # ========== Step 7: 调用 Agent ==========
-    print("💬 Step 7: 调用 Agent...")
-    print("-" * 70)
+    progress.emit("invoke", 0.75, "💬 Step 7: 调用 Agent...")
     
     # 准备调用参数
     payload = {
@@ -196,16 +253,52 @@ def main():
     print()
     print("-" * 70)
     print()
-    
-    # ========== Step 8: 清理资源 ==========
-    print("🧹 Step 8: 清理资源...")
+
+    # ========== Step 7.5: 批量调用 Agent ==========
+    progress.emit("invoke_batch", 0.8, "💬 Step 7.5: 批量调用 Agent (invoke_batch)...")
+
+    # ✅ 使用 invoke_batch 并发发送多个请求：各线程重叠网络等待，
+    # 底层复用进程级共享的 HTTP 连接池（keep-alive，免去重复握手）
+    batch_payloads = [
+        {"prompt": "用一句话总结什么是任务分解。"},
+        {"prompt": "用一句话总结什么是时间管理。"},
+        {"prompt": "用一句话总结什么是目标规划。"},
+    ]
+
+    print(f"📤 并发发送 {len(batch_payloads)} 个请求...")
+    batch_results = client.invoke_batch(
+        payloads=batch_payloads,
+        headers=headers,
+        concurrency=4
+    )
+
+    for i, batch_result in enumerate(batch_results, 1):
+        if batch_result.success:
+            response = batch_result.get_response() if hasattr(batch_result, 'get_response') else batch_result.response
+            print(f"   [{i}] ✅ {response}")
+        else:
+            print(f"   [{i}] ❌ {batch_result.error}")
+
+    print()
     print("-" * 70)
+    print()
+
+    # ========== Step 8: 清理资源 ==========
+    progress.emit("cleanup", 0.875, "🧹 Step 8: 清理资源...")
     
-    cleanup = input("是否清理资源（停止并删除容器）? (y/N): ").strip().lower()
-    
+    if sys.stdin.isatty():
+        cleanup = input("是否清理资源（停止并删除容器）? (y/N): ").strip().lower()
+    else:
+        # 非交互环境（CI/批处理）：不阻塞在 input() 上，由环境变量决定，默认清理
+        cleanup = os.environ.get("AGENTKIT_AUTO_CLEANUP", "y").strip().lower()
+        print(f"检测到非交互环境，AGENTKIT_AUTO_CLEANUP={cleanup}")
+
+    # 无论走哪个分支，兜底清理都不再需要触发
+    cleanup_state["armed"] = False
+
     if cleanup == 'y':
         destroy_result = client.destroy(force=True)
-        
+
         if destroy_result.success:
             print(f"✅ {destroy_result.message}")
         else:
@@ -217,26 +310,20 @@ def main():
         print("   agentkit destroy")
     
     print()
-    print("=" * 70)
-    print("✅ 工作流完成!")
+    progress.emit("done", 1.0, "✅ 工作流完成!")
     print("=" * 70)
     print()
     
     # ========== 总结 ==========
-    print("📝 工作流总结:")
-    print(f"   • 项目路径: {init_result.project_path}")
-    print(f"   • 配置文件: {init_result.config_file}")
-    print(f"   • 启动模式: {config.launch_type}")
-    print(f"   • 镜像名称: {build_result.image_name if build_result.success else 'N/A'}")
-    print(f"   • 服务端点: {deploy_result.endpoint_url if deploy_result.success else 'N/A'}")
-    print()
-    
-    print("🎯 下一步操作:")
-    print(f"   1. 查看项目文件: cd {init_result.project_path}")
-    print(f"   2. 修改代码: vim {init_result.project_path}/{config.entry_point}")
-    print(f"   3. 重新构建: cd {init_result.project_path} && agentkit build")
-    print("   4. 查看状态: agentkit status")
-    print()
+    summary_ctx = {
+        "project_path": init_result.project_path,
+        "config_file": init_result.config_file,
+        "launch_type": config.launch_type,
+        "entry_point": config.entry_point,
+        "image_name": build_result.image_name if build_result.success else "N/A",
+        "endpoint_url": deploy_result.endpoint_url if deploy_result.success else "N/A",
+    }
+    sys.stdout.write(SUMMARY_TMPL.format(**summary_ctx))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,53 @@
+#!/usr/bin/env bash
+#
+# Build a standalone `agentkit` CLI binary with PyInstaller so users skip
+# Python interpreter startup and import-graph traversal on every invocation
+# (300ms-1s per call, which adds up in CI loops that poll `agentkit status`).
+#
+# The artifact is cached under .cache/agentkit-cli keyed by the SHA256 of
+# pyproject.toml plus the agentkit package sources, so repeated runs with an
+# unchanged tree are a no-op.
+#
+# Usage:
+#     ./tools/build_cli_binary.sh [output_dir]
+#
+# Requires: pip install pyinstaller
+
+set -euo pipefail
+
+REPO_ROOT="$(cd "$(dirname "$0")/.." && pwd)"
+OUTPUT_DIR="${1:-${REPO_ROOT}/dist}"
+CACHE_DIR="${REPO_ROOT}/.cache/agentkit-cli"
+
+cd "${REPO_ROOT}"
+
+# Hash of everything that affects the binary
+SOURCE_HASH=$(
+    {
+        cat pyproject.toml
+        find agentkit -name '*.py' -type f | LC_ALL=C sort | xargs cat
+    } | sha256sum | cut -d' ' -f1
+)
+
+CACHED_BINARY="${CACHE_DIR}/agentkit-${SOURCE_HASH}"
+mkdir -p "${CACHE_DIR}" "${OUTPUT_DIR}"
+
+if [ -f "${CACHED_BINARY}" ]; then
+    echo "✓ Cache hit (${SOURCE_HASH:0:12}), reusing compiled CLI"
+    cp "${CACHED_BINARY}" "${OUTPUT_DIR}/agentkit"
+    exit 0
+fi
+
+echo "Building agentkit CLI binary (${SOURCE_HASH:0:12})..."
+pyinstaller \
+    --onefile \
+    --name agentkit \
+    --collect-submodules agentkit \
+    --collect-data agentkit \
+    --distpath "${OUTPUT_DIR}" \
+    --workpath "${CACHE_DIR}/build" \
+    --specpath "${CACHE_DIR}" \
+    agentkit/toolkit/cli/__main__.py
+
+cp "${OUTPUT_DIR}/agentkit" "${CACHED_BINARY}"
+echo "✓ Built ${OUTPUT_DIR}/agentkit"
@@ -29,15 +29,242 @@
 
 import json
 import argparse
+import hashlib
+import logging
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List, Set, Tuple
-from collections import defaultdict
+
+try:
+    import orjson  # 可选依赖：大 JSON 的解析比标准库快数倍
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# 生成逻辑变化时递增，确保旧缓存自动失效
+TOOL_VERSION = "1"
+
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "agentkit-codegen")
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """把预编码好的字节一次性写入文件
+
+    直接走 os.write，绕过 TextIOWrapper 的增量编码器和
+    BufferedWriter 的分块刷新，大文件只需一两次系统调用。
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _parse_api_bytes(raw: bytes) -> dict:
+    """解析API JSON定义字节串，优先使用 orjson"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=8)
+def _load_api_cached(path: str, mtime_ns: int, size: int) -> Tuple[dict, bytes]:
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return _parse_api_bytes(raw), hashlib.sha256(raw).digest()
+
+
+def _load_api(path: str) -> Tuple[dict, bytes]:
+    """加载API JSON，返回 (解析结果, 内容摘要)
+
+    以 (路径, mtime, size) 记忆化：同一进程内反复驱动本工具时，
+    未变化的定义文件不再重复读盘和解析。生成器只读不改解析结果，
+    共享同一份 dict 是安全的。
+    """
+    st = os.stat(path)
+    return _load_api_cached(path, st.st_mtime_ns, st.st_size)
+
+
+def _cache_key(json_digest: bytes, args: argparse.Namespace) -> str:
+    """输入内容摘要 + 命令行参数 + 工具版本，共同决定缓存命中"""
+    h = hashlib.sha256()
+    h.update(json_digest)
+    h.update(repr(sorted(vars(args).items())).encode('utf-8'))
+    h.update(TOOL_VERSION.encode('utf-8'))
+    return h.hexdigest()
+
+
+def _cache_get(cache_path: str) -> bytes | None:
+    """读取缓存条目，不存在返回 None"""
+    try:
+        return Path(cache_path).read_bytes()
+    except OSError:
+        return None
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """先写临时文件再 os.replace，确保目标文件要么是旧内容要么是新内容
+
+    中途被打断不会留下半截文件去污染下游的构建缓存。
+    """
+    tmp = f"{path}.tmp.{os.getpid()}"
+    try:
+        _write_bytes(tmp, data)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _cache_put(cache_path: str, data: bytes) -> None:
+    """原子写入缓存条目；缓存只是加速，写入失败不影响生成"""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        _write_atomic(cache_path, data)
+    except OSError as e:
+        logger.debug("codegen cache write failed for %s: %s", cache_path, e)
+
+
+# 编码用的暂存缓冲：批量驱动本工具时跨 main() 调用复用，省掉每次
+# 从零扩容；超过软上限后重建，避免单个超大 API 让缓冲永久占着内存。
+# main() 内的编码调用是串行的（客户端编码在类型编码完成后才提交）。
+_SCRATCH = bytearray()
+_SOFT_MAX = 1 << 17  # 128 KiB
+
+
+def _encode_parts(parts) -> bytes:
+    """把代码片段流逐块编码进复用的字节缓冲
+
+    相比先 join 成完整字符串再 encode，峰值内存少一份完整模块的
+    字符串拷贝，片段间以 \\n 分隔，与 "\\n".join 语义一致。
+    """
+    global _SCRATCH
+    buf = _SCRATCH
+    buf.clear()
+    first = True
+    for piece in parts:
+        if first:
+            first = False
+        else:
+            buf += b"\n"
+        buf += piece.encode('utf-8')
+    data = bytes(buf)
+    if len(buf) > _SOFT_MAX:
+        _SCRATCH = bytearray()
+    return data
+
+
+def _count_lines(data: bytes) -> int:
+    """统计行数：单次 C 级扫描，不像 splitlines 那样按行切分配列表"""
+    count = data.count(b"\n")
+    if data and not data.endswith(b"\n"):
+        count += 1
+    return count
+
+
+def _unchanged(path: str, data: bytes) -> bool:
+    """目标文件已存在且内容一致（可跳过写入、保留 mtime）"""
+    try:
+        existing = Path(path).read_bytes()
+    except OSError:
+        return False
+    return hashlib.sha256(existing).digest() == hashlib.sha256(data).digest()
+
+
+def _flush_outputs(pending: List[Tuple[str, bytes]]) -> None:
+    """批量写出所有目标文件
+
+    先统一打开全部临时文件，再依次写入、关闭，最后统一 rename，
+    把每个文件的打开/关闭开销集中到一个批次里，原子性与
+    _write_atomic 相同。
+    """
+    tmp_suffix = f".tmp.{os.getpid()}"
+    fds: List[int] = []
+    try:
+        # 逐个打开并记录 fd：中途某个 open 失败时，之前打开的仍能在
+        # 清理分支里被关闭，不会泄漏
+        for path, _ in pending:
+            fds.append(os.open(path + tmp_suffix, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
+        try:
+            for fd, (_, data) in zip(fds, pending):
+                view = memoryview(data)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+        finally:
+            for fd in fds:
+                os.close(fd)
+            fds = []
+        for path, _ in pending:
+            os.replace(path + tmp_suffix, path)
+    except OSError:
+        for fd in fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        for path, _ in pending:
+            try:
+                os.unlink(path + tmp_suffix)
+            except OSError:
+                pass
+        raise
+
+
+# 驼峰 -> 蛇形转换用到的模式，模块加载时编译一次，
+# 避免每次转换都走 re 内部的 pattern 缓存查找
+_SNAKE_RE1 = re.compile(r"([A-Z]+)([A-Z][a-z])")   # "MCPService" -> "MCP_Service"
+_SNAKE_RE2 = re.compile(r"([a-z0-9])([A-Z])")      # "ServiceID" -> "Service_ID"
+_SNAKE_DEDUP = re.compile(r"__+")
+
+
+@lru_cache(maxsize=4096)
+def _to_snake_case(name: str) -> str:
+    """将驼峰命名转换为蛇形命名（按名称缓存，重复转换只查一次表）"""
+    if not name:
+        return name
+    step_one = _SNAKE_RE1.sub(r"\1_\2", name)
+    step_two = _SNAKE_RE2.sub(r"\1_\2", step_one)
+    # 统一转小写并去掉可能的重复下划线
+    return _SNAKE_DEDUP.sub("_", step_two).lower()
+
+
+@lru_cache(maxsize=1024)
+def _strip_generic_suffix(name: str) -> str:
+    """去掉一些通用后缀，使生成的类名更有语义，同时减少 *2 这类命名"""
+    for suffix in ("Configuration", "Config", "Info", "List", "Item", "Items"):
+        if name.endswith(suffix) and len(name) > len(suffix):
+            return name[: -len(suffix)]
+    return name
 
 
 def sanitize_docstring(text: str) -> str:
     """清理docstring内容，避免三引号导致语法错误"""
     if not text:
         return ""
+    # 快速路径：绝大多数描述本来就干净，直接原样返回，
+    # 不必走 replace + split/join 的完整清理流程
+    if (
+        '"""' not in text
+        and '\n' not in text
+        and '\r' not in text
+        and '\t' not in text
+        and '  ' not in text
+        and not text.startswith(' ')
+        and not text.endswith(' ')
+    ):
+        return text
     sanitized = text.replace('"""', '\\"\\"\\"')
     sanitized = sanitized.replace('\r', ' ').replace('\n', ' ')
     sanitized = ' '.join(sanitized.split())
@@ -66,7 +293,18 @@ class TypeMapper:
 
 class FieldInfo:
     """字段信息"""
-    def __init__(self, name: str, python_name: str, type_str: str, 
+
+    __slots__ = ("name", "python_name", "type_str", "is_required", "is_array", "description")
+
+    # (is_array, is_required) -> 字段定义模板，免去逐字段的分支和字符串包装
+    _FIELD_TEMPLATES = {
+        (False, False): '    %s: Optional[%s] = Field(default=None, alias="%s")',
+        (False, True): '    %s: %s = Field(..., alias="%s")',
+        (True, False): '    %s: Optional[list[%s]] = Field(default=None, alias="%s")',
+        (True, True): '    %s: list[%s] = Field(..., alias="%s")',
+    }
+
+    def __init__(self, name: str, python_name: str, type_str: str,
                  is_required: bool, is_array: bool, description: str = ""):
         self.name = name  # 原始名称（用作alias）
         self.python_name = python_name  # Python字段名（小写+下划线）
@@ -77,58 +315,41 @@ class FieldInfo:
         
     def to_field_definition(self) -> str:
         """生成字段定义代码"""
-        # 确定类型
-        if self.is_array:
-            final_type = f"list[{self.type_str}]"
-        else:
-            final_type = self.type_str
-            
-        # 处理可选字段
-        if not self.is_required:
-            final_type = f"Optional[{final_type}]"
-            default_value = "default=None"
-        else:
-            default_value = "..."
-            
-        # 生成Field定义
-        field_def = f'Field({default_value}, alias="{self.name}")'
-
-        return f'    {self.python_name}: {final_type} = {field_def}'
+        template = self._FIELD_TEMPLATES[(self.is_array, self.is_required)]
+        return template % (self.python_name, self.type_str, self.name)
 
 
 class NestedModel:
     """嵌套模型"""
+
+    __slots__ = ("name", "fields", "_field_names")
+
     def __init__(self, name: str):
         self.name = name
         self.fields: List[FieldInfo] = []
-        self.children: Dict[str, 'NestedModel'] = {}
-        
+        self._field_names: Set[str] = set()
+
     def add_field(self, field: FieldInfo):
-        """添加字段"""
+        """添加字段（同名字段只保留第一个，重复检查为 O(1)）"""
+        if field.python_name in self._field_names:
+            return
+        self._field_names.add(field.python_name)
         self.fields.append(field)
-        
-    def add_child(self, name: str) -> 'NestedModel':
-        """添加子模型"""
-        if name not in self.children:
-            self.children[name] = NestedModel(name)
-        return self.children[name]
+
+    def has_field(self, python_name: str) -> bool:
+        """是否已存在同名字段"""
+        return python_name in self._field_names
         
     def to_class_definition(self, indent: int = 0, base_class_name: str = "BaseModel") -> str:
         """生成类定义"""
         indent_str = "    " * indent
-        lines = []
-        
-        # 类定义
-        lines.append(f"{indent_str}class {self.name}({base_class_name}):")
-        
-        # 字段定义
         if self.fields:
-            for field in self.fields:
-                lines.append(f"{indent_str}{field.to_field_definition()}")
+            body = "\n".join(
+                f"{indent_str}{field.to_field_definition()}" for field in self.fields
+            )
         else:
-            lines.append(f"{indent_str}    pass")
-        
-        return "\n".join(lines)
+            body = f"{indent_str}    pass"
+        return f"{indent_str}class {self.name}({base_class_name}):\n{body}"
 
 
 class APIStructGenerator:
@@ -142,9 +363,23 @@ class APIStructGenerator:
         self.base_model_doc = base_model_doc or "AgentKit auto-generated base model"
         # 确保基础类名不会与生成的结构体冲突
         self.generated_class_names.add(self.base_model_name)
-        self.file_header_cache: List[str] | None = None
+        self.file_header_cache: str | None = None
+        # 响应模型字段结构 -> 首个同构类名，结构相同的响应直接生成别名
+        self._response_signatures: Dict[frozenset, str] = {}
 
     def generate_client_module(
+        self,
+        data: dict,
+        **kwargs,
+    ) -> str:
+        """根据API定义生成客户端代码（一次性返回完整字符串）"""
+        return "\n".join(self._iter_client_module_parts(data, **kwargs))
+
+    def generate_client_module_bytes(self, data: dict, **kwargs) -> bytes:
+        """生成客户端代码并逐块编码为 UTF-8 字节串"""
+        return _encode_parts(self._iter_client_module_parts(data, **kwargs))
+
+    def _iter_client_module_parts(
         self,
         data: dict,
         *,
@@ -154,68 +389,62 @@ class APIStructGenerator:
         types_module: str,
         base_class_import: str,
         base_class_name: str,
-    ) -> str:
-        """根据API定义生成客户端代码"""
+    ):
+        """逐块产出客户端代码片段"""
         api_list = data.get("ApiList", [])
         if not api_list:
-            return ""
-        lines = self._generate_file_header()
-        lines.append("from typing import Dict")
-        lines.append(f"from {base_class_import} import {base_class_name}")
-        lines.append(f"from {types_module} import (")
-        type_names = []
-        for api in api_list:
-            action = api.get("Action")
-            if not action:
-                continue
-            type_names.extend([f"{action}Request", f"{action}Response"])
-        for name in sorted(set(type_names)):
-            lines.append(f"    {name},")
-        lines.append(")")
-        lines.append("")
-        lines.append("")
+            return
+        actions = [api["Action"] for api in api_list if api.get("Action")]
+        type_names = set()
+        for action in actions:
+            type_names.update((f"{action}Request", f"{action}Response"))
+        type_imports = "\n".join(f"    {name}," for name in sorted(type_names))
+        action_entries = "\n".join(f'        "{action}": "{action}",' for action in actions)
         doc = sanitize_docstring(client_description or f"AgentKit client for {service_name}")
-        lines.append(f"class {client_class_name}({base_class_name}):")
-        lines.append(f"    \"\"\"{doc}\"\"\"")
-        lines.append("    API_ACTIONS: Dict[str, str] = {")
-        for api in api_list:
-            action = api.get("Action")
-            if not action:
-                continue
-            lines.append(f"        \"{action}\": \"{action}\",")
-        lines.append("    }")
-        lines.append("")
-        lines.append("    def __init__(")
-        lines.append("        self,")
-        lines.append("        access_key: str = \"\",")
-        lines.append("        secret_key: str = \"\",")
-        lines.append("        region: str = \"\",")
-        lines.append("        session_token: str = \"\",")
-        lines.append("    ) -> None:")
-        lines.append("        super().__init__(")
-        lines.append("            access_key=access_key,")
-        lines.append("            secret_key=secret_key,")
-        lines.append("            region=region,")
-        lines.append("            session_token=session_token,")
-        lines.append(f"            service_name=\"{service_name}\",")
-        lines.append("        )")
-        lines.append("")
-        for api in api_list:
-            action = api.get("Action")
-            if not action:
-                continue
+        # 整段产出代替逐行拼接：每块都是一段预格式化的多行代码
+        yield self._generate_file_header()
+        yield (
+            f'''from typing import Dict
+from {base_class_import} import {base_class_name}
+from {types_module} import (
+{type_imports}
+)
+
+
+class {client_class_name}({base_class_name}):
+    """{doc}"""
+    API_ACTIONS: Dict[str, str] = {{
+{action_entries}
+    }}
+
+    def __init__(
+        self,
+        access_key: str = "",
+        secret_key: str = "",
+        region: str = "",
+        session_token: str = "",
+    ) -> None:
+        super().__init__(
+            access_key=access_key,
+            secret_key=secret_key,
+            region=region,
+            session_token=session_token,
+            service_name="{service_name}",
+        )
+'''
+        )
+        for action in actions:
             method_name = self.to_snake_case(action)
-            req_type = f"{action}Request"
-            resp_type = f"{action}Response"
-            lines.append("")
-            lines.append(f"    def {method_name}(self, request: {req_type}) -> {resp_type}:")
-            lines.append("        return self._invoke_api(")
-            lines.append(f"            api_action=\"{action}\",")
-            lines.append("            request=request,")
-            lines.append(f"            response_type={resp_type},")
-            lines.append("        )")
-        lines.append("")
-        return "\n".join(lines)
+            yield (
+                f'''
+    def {method_name}(self, request: {action}Request) -> {action}Response:
+        return self._invoke_api(
+            api_action="{action}",
+            request=request,
+            response_type={action}Response,
+        )'''
+            )
+        yield ""
 
     def register_class_name(self, name: str):
         """记录已经生成的类名，避免重复"""
@@ -233,14 +462,11 @@ class APIStructGenerator:
 
     def _strip_generic_suffix(self, name: str) -> str:
         """去掉一些通用后缀，使生成的类名更有语义，同时减少 *2 这类命名"""
-        for suffix in ("Configuration", "Config", "Info", "List", "Item", "Items"):
-            if name.endswith(suffix) and len(name) > len(suffix):
-                return name[: -len(suffix)]
-        return name
+        return _strip_generic_suffix(name)
 
-    def _build_nested_base_name(self, path: str, is_array_object: bool) -> str:
-        """根据字段路径构造嵌套模型的基础类名，尽量避免使用 *2 这种后缀"""
-        parts = [self._strip_generic_suffix(p) for p in path.split(".") if p]
+    def _build_nested_base_name(self, path: Tuple[str, ...], is_array_object: bool) -> str:
+        """根据字段路径（元组）构造嵌套模型的基础类名，尽量避免使用 *2 这种后缀"""
+        parts = [self._strip_generic_suffix(p) for p in path if p]
         if not parts:
             core = "NestedModel"
         elif len(parts) == 1:
@@ -284,45 +510,48 @@ class APIStructGenerator:
     
     def to_snake_case(self, name: str) -> str:
         """将驼峰命名转换为蛇形命名"""
-        if not name:
-            return name
-        # 先在连续大写 + 小写的边界处插入下划线，例如 "MCPService" -> "MCP_Service"
-        step_one = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
-        # 再在小写/数字后接大写的地方插入下划线，例如 "ServiceID" -> "Service_ID"
-        step_two = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", step_one)
-        # 统一转小写并去掉可能的重复下划线
-        return re.sub(r"__+", "_", step_two).lower()
+        return _to_snake_case(name)
     
     def create_nested_structure(self, parameters: List[dict], action: str) -> NestedModel:
-        """创建嵌套结构"""
+        """创建嵌套结构
+
+        路径统一用字符串元组作键：哈希/比较不经过字符序列扫描，
+        取父路径和末级名称也只是切片，无需反复 split/join。
+        """
         root = NestedModel("Root")
-        path_models: Dict[str, NestedModel] = {}
+        path_models: Dict[Tuple[str, ...], NestedModel] = {}
         class_models: Dict[str, NestedModel] = {}
-        path_class_names: Dict[str, str] = {}
-        
-        # 第一遍：收集所有嵌套路径和数组字段
-        array_fields = defaultdict(set)  # 记录哪些路径有数组字段（.N.）
-        normal_fields = defaultdict(set)  # 记录哪些路径有普通字段
-        nested_object_paths = set()  # 记录所有嵌套对象路径
-        
+        path_class_names: Dict[Tuple[str, ...], str] = {}
+
+        # 每个参数的路径只解析一次，两遍处理共用解析结果
+        parsed_params = []
         for param in parameters:
-            field_name = param["Name"]
-            path_parts, final_name, is_array_item, is_simple_array = self.parse_field_path(field_name)
-            
-            if len(path_parts) > 0:
-                path_str = ".".join(path_parts)
-                
+            path_parts, final_name, is_array_item, is_simple_array = self.parse_field_path(param["Name"])
+            parsed_params.append(
+                (param, tuple(path_parts), final_name, is_array_item, is_simple_array)
+            )
+
+        # 第一遍：收集所有嵌套路径和数组字段。
+        # 这两个映射后面只做成员判断，用普通 dict + setdefault，
+        # 避免 defaultdict 在查询侧意外插入空集合
+        array_fields: Dict[Tuple[str, ...], set] = {}  # 记录哪些路径有数组字段（.N.）
+        normal_fields: Dict[Tuple[str, ...], set] = {}  # 记录哪些路径有普通字段
+        nested_object_paths = set()  # 记录所有嵌套对象路径
+
+        for param, path, final_name, is_array_item, is_simple_array in parsed_params:
+            if path:
                 if is_array_item:
                     # 记录这是一个对象数组的字段
-                    array_fields[path_str].add(final_name)
+                    array_fields.setdefault(path, set()).add(final_name)
                 else:
                     # 记录这是一个普通字段
-                    normal_fields[path_str].add(final_name)
-                
-                # 记录所有嵌套路径
-                for i in range(1, len(path_parts) + 1):
-                    nested_path = ".".join(path_parts[:i])
-                    nested_object_paths.add(nested_path)
+                    normal_fields.setdefault(path, set()).add(final_name)
+
+                # 记录所有嵌套路径前缀；
+                # 完整路径已出现过时其所有前缀必然已记录，可整体跳过
+                if path not in nested_object_paths:
+                    for i in range(1, len(path) + 1):
+                        nested_object_paths.add(path[:i])
         
         # 判断哪些路径是真正的数组对象（只有数组字段，没有普通字段）
         array_objects = {}
@@ -343,8 +572,7 @@ class APIStructGenerator:
         
         # 为数组对象创建Item模型（只有在根级别或明确的数组对象才加Item后缀）
         for array_path in array_objects:
-            parts = array_path.split(".")
-            if len(parts) == 1 or array_path in nested_object_paths:
+            if len(array_path) == 1 or array_path in nested_object_paths:
                 base_name = self._build_nested_base_name(array_path, is_array_object=True)
             else:
                 # 忽略那些仅作为中间路径、但本身不是嵌套对象的数组路径
@@ -355,26 +583,23 @@ class APIStructGenerator:
             path_class_names[array_path] = model_name
             class_models[model_name] = model
 
-        # 调试：打印 CreateMCPToolset 的嵌套路径信息
-        if action == "CreateMCPToolset":
-            print("[DEBUG] action=CreateMCPToolset nested_object_paths=", sorted(nested_object_paths))
-            print("[DEBUG] action=CreateMCPToolset array_objects=", sorted(array_objects.keys()))
+        # 调试输出默认关闭（AGENTKIT_CODEGEN_DEBUG=1 开启）；
+        # isEnabledFor 先行判断，关闭时不做 sorted 之类的格式化开销
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("action=%s nested_object_paths=%s", action, sorted(nested_object_paths))
+            logger.debug("action=%s array_objects=%s", action, sorted(array_objects.keys()))
 
         # 建立父子关系字段（包含对象和对象数组）
         for full_path in sorted(nested_object_paths):
-            parts = full_path.split(".")
-            if len(parts) < 2:
+            if len(full_path) < 2:
                 # 顶层对象由 root_refs 负责挂到根上
                 continue
-            parent_path = ".".join(parts[:-1])
-            child_name = parts[-1]
+            parent_path = full_path[:-1]
+            child_name = full_path[-1]
             if parent_path not in path_models:
                 continue
             parent_model = path_models[parent_path]
             child_python_name = self.to_snake_case(child_name)
-            existing = [f for f in parent_model.fields if f.python_name == child_python_name]
-            if existing:
-                continue
             child_type = path_class_names.get(full_path, child_name)
             is_array_object = full_path in array_objects
             field = FieldInfo(
@@ -387,25 +612,17 @@ class APIStructGenerator:
             )
             parent_model.add_field(field)
 
-        # 调试：打印 CreateMCPToolset 的父子关系字段
-        if action == "CreateMCPToolset":
+        if logger.isEnabledFor(logging.DEBUG):
             for p, m in path_models.items():
-                print(
-                    "[DEBUG] path_model",
-                    p,
-                    "-> class",
-                    m.name,
-                    "fields=",
-                    [f.python_name for f in m.fields],
+                logger.debug(
+                    "action=%s path_model %s -> class %s fields=%s",
+                    action, p, m.name, [f.python_name for f in m.fields],
                 )
 
         # 第二遍：填充字段
         root_refs = {}  # 用于跟踪根级别的对象引用
         
-        for param in parameters:
-            field_name = param["Name"]
-            path_parts, final_name, is_array_item, is_simple_array = self.parse_field_path(field_name)
-            
+        for param, path, final_name, is_array_item, is_simple_array in parsed_params:
             # 获取类型
             type_id = param.get("Type", 1)
             python_type = TypeMapper.get_python_type(type_id)
@@ -419,7 +636,7 @@ class APIStructGenerator:
             python_name = self.to_snake_case(final_name)
             
             # 处理不同情况
-            if len(path_parts) == 0:
+            if len(path) == 0:
                 # 根级别的简单字段（不是嵌套对象的入口）
                 field = FieldInfo(
                     name=final_name,
@@ -433,21 +650,17 @@ class APIStructGenerator:
                 
             elif is_simple_array:
                 # 这是一个简单数组字段（如AuthorizerConfiguration.CustomJwtAuthorizer.AllowedClients.N）
-                parent_path = ".".join(path_parts)
-                if parent_path in path_models:
-                    parent_model = path_models[parent_path]
-                    existing = [f for f in parent_model.fields if f.python_name == python_name]
-                    if not existing:
-                        field = FieldInfo(
-                            name=final_name,
-                            python_name=python_name,
-                            type_str=python_type,
-                            is_required=is_required,
-                            is_array=True,
-                            description=description
-                        )
-                        parent_model.add_field(field)
-                elif len(path_parts) == 0:
+                if path in path_models:
+                    field = FieldInfo(
+                        name=final_name,
+                        python_name=python_name,
+                        type_str=python_type,
+                        is_required=is_required,
+                        is_array=True,
+                        description=description
+                    )
+                    path_models[path].add_field(field)
+                elif len(path) == 0:
                     # 根级别的简单数组
                     field = FieldInfo(
                         name=final_name,
@@ -461,9 +674,7 @@ class APIStructGenerator:
                 
             elif is_array_item:
                 # 这是对象数组的字段（如Envs.N.Key）
-                array_path = ".".join(path_parts)
-                
-                if array_path in path_models:
+                if path in path_models:
                     field = FieldInfo(
                         name=final_name,
                         python_name=python_name,
@@ -472,13 +683,13 @@ class APIStructGenerator:
                         is_array=False,
                         description=description
                     )
-                    path_models[array_path].add_field(field)
-                    
+                    path_models[path].add_field(field)
+
                     # 确保根级别有对这个数组的引用
-                    if len(path_parts) == 1:
-                        array_name = path_parts[0]
+                    if len(path) == 1:
+                        array_name = path[0]
                         if array_name not in root_refs:
-                            ref_type = path_class_names.get(array_path, f"{array_name}Item")
+                            ref_type = path_class_names.get(path, f"{array_name}Item")
                             root_refs[array_name] = {
                                 'type': ref_type,
                                 'is_array': True,
@@ -486,9 +697,7 @@ class APIStructGenerator:
                             }
             else:
                 # 嵌套对象字段本身携带的简单属性（非子对象引用）
-                full_path = ".".join(path_parts)
-
-                if full_path in path_models:
+                if path in path_models:
                     field = FieldInfo(
                         name=final_name,
                         python_name=python_name,
@@ -497,12 +706,12 @@ class APIStructGenerator:
                         is_array=False,
                         description=description,
                     )
-                    path_models[full_path].add_field(field)
+                    path_models[path].add_field(field)
 
                 # 确保根级别的第一层对象被引用
-                root_level_name = path_parts[0]
+                root_level_name = path[0]
                 if root_level_name not in root_refs:
-                    ref_type = path_class_names.get(root_level_name, root_level_name)
+                    ref_type = path_class_names.get((root_level_name,), root_level_name)
                     root_refs[root_level_name] = {
                         'type': ref_type,
                         'is_array': False,
@@ -511,20 +720,15 @@ class APIStructGenerator:
         
         # 添加根级别的对象引用
         for ref_name, ref_info in root_refs.items():
-            python_name = self.to_snake_case(ref_name)
-            # 检查是否已存在
-            existing = [f for f in root.fields if f.python_name == python_name]
-            if not existing:
-                ref_type = ref_info['type']
-                field = FieldInfo(
-                    name=ref_name,
-                    python_name=python_name,
-                    type_str=ref_type,
-                    is_required=ref_info['is_required'],
-                    is_array=ref_info['is_array'],
-                    description=""
-                )
-                root.add_field(field)
+            field = FieldInfo(
+                name=ref_name,
+                python_name=self.to_snake_case(ref_name),
+                type_str=ref_info['type'],
+                is_required=ref_info['is_required'],
+                is_array=ref_info['is_array'],
+                description=""
+            )
+            root.add_field(field)
         
         self.nested_models = class_models
         return root
@@ -550,12 +754,9 @@ class APIStructGenerator:
             # 如果已经存在同名响应，跳过生成以避免重复
             return ""
         self.register_class_name(class_name)
-        
-        lines = []
-        lines.append(f"class {class_name}({self.base_model_name}):")
-        
+
         # 处理响应字段
-        has_fields = False
+        field_lines = []
         for param in parameters:
             name = param.get("Name", "")
             type_id = param.get("Type", 1)
@@ -580,39 +781,37 @@ class APIStructGenerator:
             python_type = f"Optional[{python_type}]"
             
             # 生成字段定义
-            field_def = f'Field(default=None, alias="{name}")'
+            field_lines.append(
+                f'    {python_name}: {python_type} = Field(default=None, alias="{name}")'
+            )
 
-            lines.append(f'    {python_name}: {python_type} = {field_def}')
-            has_fields = True
-        
-        if not has_fields:
-            lines.append("    pass")
-        
-        return "\n".join(lines)
+        # 字段结构完全相同的响应不再重复生成类，改为别名引用，
+        # 既缩小生成文件，也省掉 pydantic 重复构建模型的开销
+        signature = frozenset(field_lines)
+        existing = self._response_signatures.get(signature)
+        if existing is not None:
+            return f"# Same fields as {existing}\n{class_name} = {existing}"
+        self._response_signatures[signature] = class_name
+
+        body = "\n".join(field_lines) if field_lines else "    pass"
+        return f"class {class_name}({self.base_model_name}):\n{body}"
     
-    def generate_datatype_models(self, data_types: List[dict]) -> List[str]:
-        """从DataType节生成模型定义"""
-        lines = []
-        
+    def generate_datatype_models(self, data_types: List[dict]) -> str:
+        """从DataType节生成模型定义，每个类产出一个完整代码块"""
+        blocks = []
+
         for i, dtype in enumerate(data_types):
             struct_name = dtype.get("StructName", "")
             elements = dtype.get("Element", [])
-            
+
             if not struct_name or not elements:
                 continue
             if struct_name in self.generated_class_names:
                 continue
             self.register_class_name(struct_name)
-            
-            # 添加空行分隔不同的类（除了第一个）
-            if i > 0:
-                lines.append("")
-                lines.append("")
-            
-            # 生成类定义
-            lines.append(f"class {struct_name}({self.base_model_name}):")
-            
+
             # 生成字段
+            field_lines = []
             for element in elements:
                 elem_name = element.get("ElementName", "")
                 elem_type = element.get("ElementType", 1)
@@ -640,85 +839,183 @@ class APIStructGenerator:
                 else:
                     default_value = "..."
                 
-                lines.append(f'    {python_name}: {python_type} = Field({default_value}, alias="{elem_name}")')
-            
-        
-        return lines
-
-    def _generate_file_header(self) -> List[str]:
-        """生成通用文件头"""
-        if self.file_header_cache is not None:
-            return list(self.file_header_cache)
-        lines = []
-        lines.append("# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.")
-        lines.append("#")
-        lines.append("# Licensed under the Apache License, Version 2.0 (the \"License\");")
-        lines.append("# you may not use this file except in compliance with the License.")
-        lines.append("# You may obtain a copy of the License at")
-        lines.append("#")
-        lines.append("#     http://www.apache.org/licenses/LICENSE-2.0")
-        lines.append("#")
-        lines.append("# Unless required by applicable law or agreed to in writing, software")
-        lines.append("# distributed under the License is distributed on an \"AS IS\" BASIS,")
-        lines.append("# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.")
-        lines.append("# See the License for the specific language governing permissions and")
-        lines.append("# limitations under the License.")
-        lines.append("")
-        lines.append("# Auto-generated from API JSON definition")
-        lines.append("# Do not edit manually")
-        lines.append("")
-        lines.append("from __future__ import annotations")
-        lines.append("")
-        self.file_header_cache = lines
-        return list(lines)
+                field_lines.append(f'    {python_name}: {python_type} = Field({default_value}, alias="{elem_name}")')
+
+            # 空行分隔不同的类（除了第一个）
+            if i > 0:
+                blocks.append("\n\n\n" if blocks else "\n\n")
+            body = "\n".join(field_lines)
+            blocks.append(f"class {struct_name}({self.base_model_name}):\n{body}")
+
+        return "".join(blocks)
+
+    def _generate_file_header(self) -> str:
+        """生成通用文件头（缓存为单个字符串，复用时零拷贝）"""
+        if self.file_header_cache is None:
+            self.file_header_cache = (
+                "# Copyright (c) 2025 Beijing Volcano Engine Technology Co., Ltd. and/or its affiliates.\n"
+                "#\n"
+                '# Licensed under the Apache License, Version 2.0 (the "License");\n'
+                "# you may not use this file except in compliance with the License.\n"
+                "# You may obtain a copy of the License at\n"
+                "#\n"
+                "#     http://www.apache.org/licenses/LICENSE-2.0\n"
+                "#\n"
+                "# Unless required by applicable law or agreed to in writing, software\n"
+                '# distributed under the License is distributed on an "AS IS" BASIS,\n'
+                "# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.\n"
+                "# See the License for the specific language governing permissions and\n"
+                "# limitations under the License.\n"
+                "\n"
+                "# Auto-generated from API JSON definition\n"
+                "# Do not edit manually\n"
+                "\n"
+                "from __future__ import annotations\n"
+            )
+        return self.file_header_cache
     
     def generate_from_api_json(self, data: dict) -> str:
-        """从API JSON数据生成所有模型"""
-        lines = self._generate_file_header()
-        lines.append("from typing import Optional")
-        lines.append("from pydantic import BaseModel, Field")
-        lines.append("")
-        lines.append("\n".join([
-            f"class {self.base_model_name}(BaseModel):",
-            f"    \"\"\"{self.base_model_doc}\"\"\"",
-            "    model_config = {",
-            '        "populate_by_name": True,',
-            '        "arbitrary_types_allowed": True',
-            "    }",
-        ]))
-        lines.append("")
-        lines.append("")
+        """从API JSON数据生成所有模型（一次性返回完整字符串）"""
+        return "\n".join(self._iter_api_module_parts(data))
+
+    def generate_from_api_json_bytes(self, data: dict) -> bytes:
+        """生成所有模型并逐块编码为 UTF-8 字节串"""
+        return _encode_parts(self._iter_api_module_parts(data))
+
+    def _iter_api_module_parts(self, data: dict):
+        """逐块产出类型定义代码片段"""
+        yield self._generate_file_header()
+        yield (
+            f'''from typing import Optional
+from pydantic import BaseModel, Field
+
+class {self.base_model_name}(BaseModel):
+    """{self.base_model_doc}"""
+    model_config = {{
+        "populate_by_name": True,
+        "arbitrary_types_allowed": True
+    }}
+
+'''
+        )
         # 首先生成DataType中定义的结构体
         data_types = data.get("DataType")
         if data_types:
-            lines.append("# Data Types")
-            datatype_lines = self.generate_datatype_models(data_types)
-            lines.extend(datatype_lines)
-            lines.append("")
-            lines.append("")
-        
+            datatype_block = self.generate_datatype_models(data_types)
+            yield f"# Data Types\n{datatype_block}\n\n"
+
         # 处理每个API
         api_list = data.get("ApiList", [])
         for api in api_list:
             action = api.get("Action", "")
             request_params = api.get("RequestParameters", [])
             response_params = api.get("ResponseParameters", [])
-            
+
             # 生成请求模型
             if request_params:
-                lines.append(f"# {action} - Request")
-                lines.append(self.generate_request_model(action, request_params))
-                lines.append("")
-                lines.append("")
-            
+                request_block = self.generate_request_model(action, request_params)
+                yield f"# {action} - Request\n{request_block}\n\n"
+
             # 生成响应模型
             if response_params:
-                lines.append(f"# {action} - Response")
-                lines.append(self.generate_response_model(action, response_params))
-                lines.append("")
-                lines.append("")
-        
-        return "\n".join(lines)
+                response_block = self.generate_response_model(action, response_params)
+                yield f"# {action} - Response\n{response_block}\n\n"
+
+
+def _generate_one(args: argparse.Namespace) -> Tuple[bool, str]:
+    """处理单个JSON输入文件，返回 (是否有待更新的输出, 摘要文本)。
+
+    顶层函数，便于多输入模式下经 ProcessPoolExecutor 序列化到子进程执行。
+    """
+    # 生成代码；输入内容与参数都未变时直接复用上次的生成结果
+    api_data, json_digest = _load_api(args.json_file)
+    cache_key = _cache_key(json_digest, args)
+
+    generator = APIStructGenerator(
+        base_model_name=args.base_class_name,
+        base_model_doc=args.base_class_doc,
+    )
+
+    types_cache_path = os.path.join(_CACHE_DIR, f"{cache_key}.types.py")
+    types_bytes = _cache_get(types_cache_path)
+    if types_bytes is None:
+        types_bytes = generator.generate_from_api_json_bytes(api_data)
+        _cache_put(types_cache_path, types_bytes)
+
+    def _build_client_bytes() -> bytes:
+        client_cache_path = os.path.join(_CACHE_DIR, f"{cache_key}.client.py")
+        cached = _cache_get(client_cache_path)
+        if cached is not None:
+            return cached
+        client_bytes = generator.generate_client_module_bytes(
+            api_data,
+            client_class_name=args.client_class_name,
+            client_description=args.client_description or "",
+            service_name=args.service_name,
+            types_module=args.types_module,
+            base_class_import=args.base_class_import,
+            base_class_name=args.base_client_class,
+        )
+        _cache_put(client_cache_path, client_bytes)
+        return client_bytes
+
+    client_future = None
+    if args.client_output:
+        missing = []
+        if not args.client_class_name:
+            missing.append("--client-class-name")
+        if not args.service_name:
+            missing.append("--service-name")
+        if not args.types_module:
+            missing.append("--types-module")
+        if missing:
+            raise ValueError("缺少生成客户端所需参数: " + ", ".join(missing))
+        # 客户端代码生成是纯 Python 计算，和类型文件写盘（os.write 会释放
+        # GIL）互相重叠；类型代码此时已生成完毕，generator 不会被并发使用
+        executor = ThreadPoolExecutor(max_workers=2)
+        client_future = executor.submit(_build_client_bytes)
+
+    # 收集所有需要落盘的输出，最后一批写出；
+    # 类型文件的内容比对与客户端代码生成在时间上重叠
+    pending: List[Tuple[str, bytes]] = []
+    if not _unchanged(args.output, types_bytes):
+        pending.append((args.output, types_bytes))
+
+    client_bytes = None
+    if client_future is not None:
+        client_bytes = client_future.result()
+        executor.shutdown(wait=False)
+        if not _unchanged(args.client_output, client_bytes):
+            pending.append((args.client_output, client_bytes))
+
+    if args.check:
+        # 校验模式：不落盘，让 make/监控类工具依据退出码决定是否级联重建
+        if pending:
+            stale = ", ".join(path for path, _ in pending)
+            return True, "" if args.quiet else f"✗ 输出需要重新生成: {stale}\n"
+        return False, "" if args.quiet else "✓ 输出已是最新\n"
+
+    if pending:
+        _flush_outputs(pending)
+
+    if args.quiet:
+        return bool(pending), ""
+
+    # 摘要拼成一个字符串、一次 write，而不是逐行 print 各发一次系统调用
+    types_line_count = _count_lines(types_bytes)
+    summary_parts = [
+        f"✓ 成功生成结构体定义: {args.output}\n"
+        f"  - 从: {args.json_file}\n"
+        f"  - 共生成 {types_line_count} 行代码\n"
+    ]
+    if client_bytes is not None:
+        client_line_count = _count_lines(client_bytes)
+        summary_parts.append(
+            f"✓ 成功生成客户端: {args.client_output}\n"
+            f"  - From: {args.json_file}\n"
+            f"  - Lines: {client_line_count}\n"
+        )
+    return bool(pending), "".join(summary_parts)
 
 
 def main():
@@ -727,7 +1024,8 @@ def main():
     )
     parser.add_argument(
         "json_file",
-        help="API JSON定义文件路径"
+        nargs="+",
+        help="API JSON定义文件路径（可指定多个，多文件时并行生成）"
     )
     parser.add_argument(
         "--output", "-o",
@@ -774,57 +1072,58 @@ def main():
         default="AgentKit auto-generated base model",
         help="基础类的文档字符串 (默认: AgentKit auto-generated base model)"
     )
+    parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="不输出生成摘要（CI等场景下省去行数统计和格式化）"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="只校验不写入：输出已是最新时退出码为0，否则为1（保留文件mtime）"
+    )
     
     args = parser.parse_args()
-    
-    # 生成代码
-    with open(args.json_file, 'r', encoding='utf-8') as f:
-        api_data = json.load(f)
 
-    generator = APIStructGenerator(
-        base_model_name=args.base_class_name,
-        base_model_doc=args.base_class_doc,
-    )
-    generated_code = generator.generate_from_api_json(api_data)
-    
-    # 写入文件
-    with open(args.output, 'w', encoding='utf-8') as f:
-        f.write(generated_code)
-    
-    print(f"✓ 成功生成结构体定义: {args.output}")
-    print(f"  - 从: {args.json_file}")
-    print(f"  - 共生成 {len(generated_code.splitlines())} 行代码")
+    # 诊断日志默认关闭，设置 AGENTKIT_CODEGEN_DEBUG=1 开启
+    if os.environ.get("AGENTKIT_CODEGEN_DEBUG") == "1":
+        logging.basicConfig(level=logging.DEBUG, format="%(levelname)s %(name)s: %(message)s")
 
+    if len(args.json_file) == 1:
+        # 单文件：行为与历史版本完全一致
+        job = argparse.Namespace(**{**vars(args), "json_file": args.json_file[0]})
+        stale, summary = _generate_one(job)
+        if summary:
+            sys.stdout.write(summary)
+        if args.check and stale:
+            sys.exit(1)
+        return
+
+    # 多文件：各输入之间完全独立，用子进程并行生成（纯 CPU 工作，
+    # 多进程绕开 GIL）。此模式下 --output 作为输出目录，按输入文件名
+    # 派生 <服务名>_types.py；客户端参数是单服务专属的，不支持多文件
     if args.client_output:
-        required_client_args = [
-            args.client_class_name,
-            args.service_name,
-            args.types_module,
-        ]
-        if not all(required_client_args):
-            missing = [
-                name for name, value in [
-                    ("--client-class-name", args.client_class_name),
-                    ("--service-name", args.service_name),
-                    ("--types-module", args.types_module),
-                ] if not value
-            ]
-            missing_str = ", ".join(missing)
-            raise ValueError(f"缺少生成客户端所需参数: {missing_str}")
-        client_code = generator.generate_client_module(
-            api_data,
-            client_class_name=args.client_class_name,
-            client_description=args.client_description or "",
-            service_name=args.service_name,
-            types_module=args.types_module,
-            base_class_import=args.base_class_import,
-            base_class_name=args.base_client_class,
-        )
-        with open(args.client_output, 'w', encoding='utf-8') as f:
-            f.write(client_code)
-        print(f"✓ 成功生成客户端: {args.client_output}")
-        print(f"  - From: {args.json_file}")
-        print(f"  - Lines: {len(client_code.splitlines())}")
+        raise ValueError("--client-output 只支持单个JSON输入文件")
+
+    os.makedirs(args.output, exist_ok=True)
+    jobs = []
+    for json_file in args.json_file:
+        stem = Path(json_file).stem.removesuffix("_all_apis")
+        jobs.append(argparse.Namespace(**{
+            **vars(args),
+            "json_file": json_file,
+            "output": os.path.join(args.output, f"{stem}_types.py"),
+        }))
+
+    workers = min(len(jobs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_generate_one, jobs))
+
+    output = "".join(summary for _, summary in results)
+    if output:
+        sys.stdout.write(output)
+    if args.check and any(stale for stale, _ in results):
+        sys.exit(1)
 
 
 if __name__ == "__main__":